@@ -15,7 +15,7 @@ from decimal import Decimal, InvalidOperation
 import pandas as pd
 
 from app.models.dl_products import get_valid_analysis_centers, str_to_datetime
-from PySide6.QtCore import QObject, Signal, Qt, QDateTime, QThread
+from PySide6.QtCore import QObject, Signal, Qt, QDateTime, QThreadPool
 from PySide6.QtGui import QStandardItemModel, QStandardItem
 from PySide6.QtWidgets import (
     QFileDialog,
@@ -38,7 +38,7 @@ from app.models.rinex_extractor import RinexExtractor
 from app.utils.cddis_credentials import save_earthdata_credentials
 from app.models.archive_manager import (archive_products_if_rinex_changed)
 from app.models.archive_manager import archive_old_outputs
-from app.utils.workers import DownloadWorker
+from app.utils.workers import DownloadWorker, format_error
 
 
 class InputController(QObject):
@@ -301,16 +301,9 @@ class InputController(QObject):
             start_epoch = str_to_datetime(result['start_epoch'])
             end_epoch = str_to_datetime(result['end_epoch'])
             self.worker = DownloadWorker(start_epoch=start_epoch, end_epoch=end_epoch, analysis_centers=True)
-            self.metadata_thread = QThread()
-            self.worker.moveToThread(self.metadata_thread)
-
             self.worker.finished.connect(self._on_cddis_ready)
-            self.worker.finished.connect(self.worker.deleteLater)
-            self.worker.finished.connect(self.metadata_thread.quit)
             self.worker.error.connect(self._on_cddis_error)
-            self.metadata_thread.finished.connect(self.metadata_thread.deleteLater)
-            self.metadata_thread.started.connect(self.worker.run)
-            self.metadata_thread.start()
+            QThreadPool.globalInstance().start(self.worker.run)
 
             # Populate extracted metadata immediately
             self.ui.constellationsValue.setText(result["constellations"])
@@ -527,11 +520,11 @@ class InputController(QObject):
         if log_messages:
             self.ui.terminalTextEdit.append(f"✅ CDDIS archive scan complete. Found PPP product providers: {', '.join(self.valid_analysis_centers)}")
 
-    def _on_cddis_error(self, msg):
+    def _on_cddis_error(self, error):
         """
-        UI handler: report CDDIS worker error to the UI.
+        UI handler: report CDDIS worker error (exception) to the UI.
         """
-        self.ui.terminalTextEdit.append(f"Error loading CDDIS data: {msg}")
+        self.ui.terminalTextEdit.append(f"Error loading CDDIS data: {format_error(error)}")
         self.ui.PPP_provider.clear()
         self.ui.PPP_provider.addItem("None")
 
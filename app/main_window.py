@@ -1,8 +1,8 @@
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import QUrl, Signal, QThread, Slot, Qt, QRegularExpression
-from PySide6.QtWidgets import QMainWindow, QDialog, QVBoxLayout, QPushButton, QComboBox
+from PySide6.QtCore import QUrl, Signal, QThreadPool, Slot, Qt, QRegularExpression
+from PySide6.QtWidgets import QApplication, QMainWindow, QDialog, QVBoxLayout, QPushButton, QComboBox
 from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtGui import QTextCursor, QTextDocument
 
@@ -12,7 +12,7 @@ from app.utils.ui_compilation import compile_ui
 from app.controllers.input_controller import InputController
 from app.controllers.visualisation_controller import VisualisationController
 from app.utils.cddis_email import get_username_from_netrc, write_email, test_cddis_connection
-from app.utils.workers import PeaExecutionWorker, DownloadWorker
+from app.utils.workers import PeaExecutionWorker, DownloadWorker, format_error
 from app.models.archive_manager import archive_products_if_selection_changed, archive_products, archive_old_outputs
 from app.models.execution import INPUT_PRODUCTS_PATH
 
@@ -66,6 +66,8 @@ class MainWindow(QMainWindow):
         self.is_processing = False
         self.atx_required_for_rnx_extraction = False # File required to extract info from RINEX
         self.metadata_downloaded = False
+        self.worker: Optional[PeaExecutionWorker] = None  # Created on first PEA run, then reused
+        self.pea_running = False  # Whether self.worker is executing, it outlives its runs
 
         # Visualisation widgets
         self.openInBrowserBtn = QPushButton("Open in Browser", self)
@@ -81,23 +83,17 @@ class MainWindow(QMainWindow):
         # Validate connection then start metadata download in a separate thread
         self._validate_cddis_credentials_once()
 
-        self.metadata_thread = QThread()
         self.metadata_worker = DownloadWorker()
-        self.metadata_worker.moveToThread(self.metadata_thread)
 
         # Signals
-        self.metadata_thread.started.connect(self.metadata_worker.run)
         self.metadata_worker.progress.connect(self._on_download_progress)
         self.metadata_worker.log.connect(self.log_message)
         self.metadata_worker.error.connect(self._on_download_error)
         self.metadata_worker.finished.connect(self._on_metadata_download_finished)
         self.metadata_worker.atx_downloaded.connect(self._on_atx_downloaded)
 
-        # Cleanup
-        self.metadata_worker.finished.connect(self.metadata_thread.quit)
-        self.metadata_worker.finished.connect(self.metadata_worker.deleteLater)
-        self.metadata_thread.finished.connect(self.metadata_thread.deleteLater)
-        self.metadata_thread.start()
+        # Runs on the shared pool, the worker reference is kept for stop() and its signals
+        QThreadPool.globalInstance().start(self.metadata_worker.run)
 
         # Added: wire an optional stop-all button if present in the UI
         if hasattr(self.ui, "stopAllButton") and self.ui.stopAllButton:
@@ -105,6 +101,9 @@ class MainWindow(QMainWindow):
         elif hasattr(self.ui, "btnStopAll") and self.ui.btnStopAll:
             self.ui.btnStopAll.clicked.connect(self.on_stopAllClicked)
 
+        # Jobs on the global QThreadPool keep the process alive until they return, stop them when the app quits
+        QApplication.instance().aboutToQuit.connect(self._on_about_to_quit)
+
     def log_message(self, msg: str):
         """Append a log line normally """
         self.ui.terminalTextEdit.append(msg)
@@ -174,27 +173,16 @@ class MainWindow(QMainWindow):
         self.download_progress.clear()
 
         # Start download in background
-        self.download_thread = QThread()
         self.download_worker = DownloadWorker(products=products, start_epoch=self.inputCtrl.start_time, end_epoch=self.inputCtrl.end_time)
-        self.download_worker.moveToThread(self.download_thread)
 
         # Signals
-        self.download_thread.started.connect(self.download_worker.run)
         self.download_worker.progress.connect(self._on_download_progress)
         self.download_worker.log.connect(self.log_message)
         self.download_worker.finished.connect(self._on_download_finished)
         self.download_worker.error.connect(self._on_download_error)
 
-        # Cleanup
-        self.download_worker.finished.connect(self.download_thread.quit)
-        self.download_worker.finished.connect(self.download_worker.deleteLater)
-        self.download_thread.finished.connect(self.download_thread.deleteLater)
-
-        self.download_worker.error.connect(self.download_thread.quit)
-        self.download_worker.error.connect(self.download_worker.deleteLater)
-
         self.log_message("📡 Starting PPP product downloads...")
-        self.download_thread.start()
+        QThreadPool.globalInstance().start(self.download_worker.run)
 
     @Slot(str, int)
     def _on_download_progress(self, filename: str, percent: int):
@@ -238,34 +226,33 @@ class MainWindow(QMainWindow):
         self.log_message(message)
         self._start_pea_execution()
 
-    def _on_download_error(self, msg):
-        self.log_message(f"⚠️ PPP download error: {msg}")
+    def _on_download_error(self, error):
+        self.log_message(f"⚠️ PPP download error: {format_error(error)}")
         self._set_processing_state(False)
 
     def _start_pea_execution(self):
         self.log_message("⚙️ Starting PEA execution in background...")
 
-        self.thread = QThread()
-        self.worker = PeaExecutionWorker(self.execution)
-        self.worker.moveToThread(self.thread)
-
-        self.thread.started.connect(self.worker.run)
-        self.worker.finished.connect(self._on_pea_finished)
-        self.worker.error.connect(self._on_pea_error)
+        # self.execution never changes, so one worker (and its signal connections) serves every run
+        if self.worker is None:
+            self.worker = PeaExecutionWorker(self.execution)
+            self.worker.finished.connect(self._on_pea_finished)
+            self.worker.error.connect(self._on_pea_error)
 
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.thread.finished.connect(self.thread.deleteLater)
-
-        self.thread.start()
+        self.pea_running = True
+        QThreadPool.globalInstance().start(self.worker.run)
 
     def _on_pea_finished(self):
+        if not self.pea_running:
+            return  # A stop and the interrupted run both report finished, handle it once
+        self.pea_running = False
         self.log_message("✅ PEA processing completed.")
         self._run_visualisation()
         self._set_processing_state(False)
 
-    def _on_pea_error(self, msg: str):
-        self.log_message(f"⚠️ PEA execution failed: {msg}")
+    def _on_pea_error(self, error: Exception):
+        self.pea_running = False
+        self.log_message(f"⚠️ PEA execution failed: {format_error(error)}")
         self._set_processing_state(False)
 
     def _run_visualisation(self):
@@ -318,6 +305,11 @@ class MainWindow(QMainWindow):
         write_email(email_candidate)
         self.log_message(f"✉️ EMAIL set to: {email_candidate}")
 
+    @Slot()
+    def _on_about_to_quit(self):
+        self.metadata_worker.stop()  # Not covered by the stop-all button, metadata is still wanted mid-session
+        self.on_stopAllClicked()
+
     # Added: unified stop entry, wired to an optional UI button
     @Slot()
     def on_stopAllClicked(self):
@@ -340,7 +332,7 @@ class MainWindow(QMainWindow):
 
         # Stop PEA execution, if running
         try:
-            if hasattr(self, "worker") and self.worker is not None and hasattr(self.worker, "stop"):
+            if self.pea_running and self.worker is not None and hasattr(self.worker, "stop"):
                 # self.log_message("[UI] Stop → PEA worker")
                 self.worker.stop()
         except Exception:
@@ -1,6 +1,10 @@
 # app/utils/archive_manager.py
 
+import errno
+import fnmatch
 import logging
+import os
+import re
 from pathlib import Path
 import shutil
 from datetime import datetime
@@ -8,6 +12,61 @@ from typing import Optional, Dict, Any
 
 from app.utils.common_dirs import INPUT_PRODUCTS_PATH
 
+OUTPUT_EXTENSIONS = {".pos", ".POS", ".log", ".txt", ".json"}
+
+
+def _move(src, dst):
+    """
+    Moves a file with a single rename, only copying via shutil.move() if dst is on another filesystem.
+
+    :param src: source path
+    :param dst: destination path
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
+
+
+def _scan(root: Path, subdirs) -> dict[str, list[os.DirEntry]]:
+    """
+    Lists each directory once so several patterns can be matched without re-walking it.
+
+    :param root: base directory
+    :param subdirs: subdirectories of root to list, "" for root itself
+    :return: entries of each existing subdirectory
+    """
+    listing = {}
+    for subdir in subdirs:
+        directory = root / subdir
+        if directory.is_dir():
+            with os.scandir(directory) as entries:
+                listing[subdir] = list(entries)
+    return listing
+
+
+def _match(listing: dict[str, list[os.DirEntry]], patterns: list[str]) -> list[os.DirEntry]:
+    """
+    Single pass equivalent of root.glob(pattern) for every pattern, e.g. "*.SP3" or "tables/ALOAD*".
+
+    :param listing: directory entries, see _scan()
+    :param patterns: glob patterns relative to root
+    :return: matching entries, each at most once
+    """
+    by_dir = {}
+    for pattern in patterns:
+        subdir, _, name = pattern.rpartition("/")
+        by_dir.setdefault(subdir, []).append(fnmatch.translate(name))
+
+    matches = []
+    for subdir, regexes in by_dir.items():
+        # Path.glob is case-insensitive on Windows, e.g. "*.SP3" must also match legacy "cod21042.sp3" there
+        matcher = re.compile("|".join(regexes), re.IGNORECASE if os.name == "nt" else 0)
+        matches.extend(entry for entry in listing.get(subdir, []) if matcher.match(entry.name))
+    return matches
+
 
 def archive_old_outputs(output_dir: Path, visual_dir: Path = None):
     """
@@ -25,23 +84,25 @@ def archive_old_outputs(output_dir: Path, visual_dir: Path = None):
 
     # Move .pos, .log, .txt, etc. from output_dir
     moved_files = 0
-    for ext in [".pos", ".POS", ".log", ".txt", ".json"]:
-        for file in output_dir.glob(f"*{ext}"):
-            shutil.move(str(file), archive_dir / file.name)
-            moved_files += 1
+    with os.scandir(output_dir) as entries:
+        outputs = [entry for entry in entries
+                   if entry.is_file(follow_symlinks=False) and os.path.splitext(entry.name)[1] in OUTPUT_EXTENSIONS]
+    for entry in outputs:
+        _move(entry.path, archive_dir / entry.name)
+        moved_files += 1
 
     # Move HTML visual files (optional)
     if visual_dir and visual_dir.exists():
         visual_archive = archive_dir / "visual"
         visual_archive.mkdir(parents=True, exist_ok=True)
         for html_file in visual_dir.glob("*.html"):
-            shutil.move(str(html_file), visual_archive / html_file.name)
+            _move(html_file, visual_archive / html_file.name)
             moved_files += 1
 
     if moved_files > 0:
-        print(f"📦 Archived {moved_files} old output file(s) to: {archive_dir}")
+        logging.info(f"[Archiver] Archived {moved_files} old output file(s) to: {archive_dir}")
     else:
-        print("📂 No previous outputs found to archive.")
+        logging.info("[Archiver] No previous outputs found to archive.")
 
 def archive_products(products_dir: Path = INPUT_PRODUCTS_PATH, reason: str = "manual", startup_archival: bool = False,
                      include_patterns: Optional[list[str]] = None) -> Optional[Path]:
@@ -80,7 +141,7 @@ def archive_products(products_dir: Path = INPUT_PRODUCTS_PATH, reason: str = "ma
             "tables/ALOAD*",
             "tables/OLOAD*",
             "tables/gpt_*.grd",
-            "tables/qzss_*"
+            "tables/qzss_*",
             "tables/igrf*coeffs.txt",
             "tables/DE436*",
             "tables/fes2014*.dat",
@@ -94,27 +155,32 @@ def archive_products(products_dir: Path = INPUT_PRODUCTS_PATH, reason: str = "ma
         products_dir.mkdir(parents=True, exist_ok=True)
         (products_dir / "tables").mkdir(parents=True, exist_ok=True)
 
-        # Scans every file and checks created within 7 days
-        for pattern in startup_patterns:
-            for file in products_dir.glob(pattern):
-                creation_time = datetime.fromtimestamp(file.stat().st_ctime)
-                if (datetime.now() - creation_time).days > 7:
-                    logging.info(f"[Archiver] Startup archival: {file.name} is older than 7 days, archiving.")
-                    product_patterns.append(pattern)
-
     # Include explicit patterns if provided
     if include_patterns:
         product_patterns.extend(include_patterns)
 
+    # List products_dir (and subdirectories used by patterns) once, then match in memory
+    all_patterns = product_patterns + (startup_patterns if startup_archival else [])
+    listing = _scan(products_dir, {pattern.rpartition("/")[0] for pattern in all_patterns})
+
+    if startup_archival:
+        # Scans every file and checks created within 7 days
+        for pattern in startup_patterns:
+            for entry in _match(listing, [pattern]):
+                creation_time = datetime.fromtimestamp(entry.stat().st_ctime)
+                if (datetime.now() - creation_time).days > 7:
+                    logging.info(f"[Archiver] Startup archival: {entry.name} is older than 7 days, archiving.")
+                    if pattern not in product_patterns:
+                        product_patterns.append(pattern)
+
     archived_files = []
-    for pattern in product_patterns:
-        for file in products_dir.glob(pattern):
-            try:
-                target = archive_dir / file.name
-                shutil.move(str(file), str(target))
-                archived_files.append(file.name)
-            except Exception as e:
-                logging.warning(f"[Archiver] Failed to archive {file.name}: {e}")
+    for entry in _match(listing, product_patterns):
+        try:
+            target = archive_dir / entry.name
+            _move(entry.path, target)
+            archived_files.append(entry.name)
+        except Exception as e:
+            logging.warning(f"[Archiver] Failed to archive {entry.name}: {e}")
 
     if archived_files:
         logging.info(f"[Archiver] Archived {', '.join(archived_files)} → {archive_dir}")
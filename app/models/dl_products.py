@@ -1,22 +1,52 @@
-import gzip, os, shutil, unlzw3, requests
+import gzip, json, logging, os, queue, re, shutil, subprocess, threading, requests
 import pandas as pd
 import numpy as np
-from bs4 import BeautifulSoup, SoupStrainer
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from email.utils import formatdate
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Callable, Generator, List
+from typing import Optional, Callable, Generator, List, Iterable
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3 import Timeout
+from urllib3.exceptions import HTTPError as Urllib3Error
+from urllib3.util import Retry
 
 from app.utils.cddis_email import get_netrc_auth
-from app.utils.common_dirs import INPUT_PRODUCTS_PATH
+from app.utils.common_dirs import INPUT_PRODUCTS_PATH, LISTING_CACHE_PATH
 from app.utils.gn_functions import GPSDate
 
+logger = logging.getLogger(__name__)
+
 BASE_URL = "https://cddis.nasa.gov/archive"
 GPS_ORIGIN = np.datetime64("1980-01-06 00:00:00")  # Magic date from gn_functions
 MAX_RETRIES = 3  # download attempts
-CHUNK_SIZE = 8192  # 8 KiB
+POOL_SIZE = 32  # keep-alive connections per host
+TIMEOUT = (10, 60)  # (connect, read) seconds for file downloads
+METADATA_WORKERS = 8  # concurrent metadata downloads
+PRODUCT_WORKERS = 4  # concurrent PPP product and BRDC downloads
+LISTING_WORKERS = 6  # concurrent CDDIS week listing requests
+LISTING_TTL = timedelta(hours=1)  # reuse period of cached CDDIS listings for recent GPS weeks
+LISTING_SETTLED_WEEKS = 4  # older GPS weeks no longer receive products (finals arrive ~2 weeks late)
+REVALIDATE_AFTER = timedelta(hours=1)  # revalidated files checked or downloaded more recently are used as is
+CHUNK_SIZE = 1024 * 1024  # 1 MiB, bounds memory per in-flight download regardless of file size
+WRITE_BUFFER_SIZE = 4 * 1024 * 1024  # 4 MiB, batches several chunks into each write to disk
+EXTRACT_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+PROGRESS_INTERVAL = 1024 * 1024  # minimum bytes downloaded between progress reports
 COMPRESSED_FILETYPE = (".gz", ".gzip", ".Z")  # ignore any others (maybe add crx2rnx using hatanaka package)
 
-METADATA = [
+# Product filenames in a CDDIS weekly directory listing, matched straight from the raw HTML
+PRODUCT_FILENAME_RE = re.compile(
+    rb"\b([A-Z0-9]{3}0[A-Z0-9]{3}[A-Z0-9]{3}_\d{11}_\d{2}[A-Z]_[A-Z0-9]{3}_[A-Z0-9]{3}\.[A-Z0-9]{3}\.gz"  # AAA0OPSSNX_YYYYDDDHHMM_LEN_SMP_CNT.FMT.gz
+    rb"|[A-Z0-9]{3}\d{4}[0-7]\.[A-Z0-9]{3}\.Z)\b",  # AAAWWWWD.TYP.Z
+    re.IGNORECASE)
+
+PRODUCT_COLUMNS = ["analysis_center", "project", "date", "solution_type", "period", "resolution", "content", "format"]
+
+EOP_URL = "https://datacenter.iers.org/data/latestVersion/finals.data.iau2000.txt"  # Updated daily by IERS
+
+METADATA = (  # Single source of the auxiliary files PEA needs, immutable so callers can't grow it between runs
     "https://files.igs.org/pub/station/general/igs_satellite_metadata.snx",
     "https://files.igs.org/pub/station/general/igs20.atx",
     "https://peanpod.s3.ap-southeast-2.amazonaws.com/aux/products/tables/OLOAD_GO.BLQ.gz",
@@ -29,8 +59,8 @@ METADATA = [
     "https://peanpod.s3.ap-southeast-2.amazonaws.com/aux/products/tables/bds_yaw_modes.snx.gz",
     "https://peanpod.s3.ap-southeast-2.amazonaws.com/aux/products/tables/qzss_yaw_modes.snx.gz",
     "https://peanpod.s3.ap-southeast-2.amazonaws.com/aux/products/tables/sat_yaw_bias_rate.snx.gz",
-    "https://datacenter.iers.org/data/latestVersion/finals.data.iau2000.txt"
-]
+    EOP_URL
+)
 
 
 def date_to_gpswk(date: datetime) -> int:
@@ -69,79 +99,126 @@ def get_product_dataframe(start_time: datetime, end_time: datetime, target_files
     else:
         target_files = [file.upper() for file in target_files]
 
-    products = pd.DataFrame(
-        columns=["analysis_center", "project", "date", "solution_type", "period", "resolution", "content", "format"])
-
     # 1. Retrieve available options
+    weeks = []
     gps_weeks = range(date_to_gpswk(start_time), date_to_gpswk(end_time) + 1)
-    for gps_week in gps_weeks:
-        url = f"https://cddis.nasa.gov/archive/gnss/products/{gps_week}/"
-        try:
-            week_files = requests.get(url, timeout=10)
-            week_files.raise_for_status()
-        except requests.RequestException as e:
-            raise requests.RequestException(f"Failed to fetch files for GPS week {gps_week}: {e}")
+    if len(gps_weeks) > 1:
+        # Listings are independent round trips, fetch them concurrently (map keeps week order)
+        with ThreadPoolExecutor(max_workers=min(LISTING_WORKERS, len(gps_weeks))) as executor:
+            listings = list(executor.map(_week_filenames, gps_weeks))
+    else:
+        listings = [_week_filenames(gps_week) for gps_week in gps_weeks]
 
+    for gps_week, filenames in zip(gps_weeks, listings):
         # 2. Extract data from available options
-        soup = BeautifulSoup(week_files.content, "html.parser",
-                             parse_only=SoupStrainer("div", class_="archiveItemTextContainer"))
-        # Above SoupStrainer makes it that only relevant items are stored in memory
-        for div in soup:
-            filename = div.get_text().split(" ")[0]
-            try:
-                if gps_week < 2237:
-                    # Format convention changed in week 2237
-                    # AAAWWWWD.TYP.Z
-                    center = filename[0:3].upper()  # e.g. "COD"
-                    _type = "FIN"  # pre-2237 were probably always final solutions :shrug:
-                    day = int(filename[7])  # e.g. "0", 0-indexed, 7 indicates weekly
-                    _format = filename[9:12].upper()  # e.g. "snx", "ssc", "sum", "erp"
-                    project = "OPS"
-                    sampling_resolution = None
-                    content = None
-                    date = gpswk_to_date(gps_week)
-                    if 0 < day < 7:
-                        date += timedelta(days=day)
-                        period = timedelta(days=1)
-                    else:
-                        period = timedelta(days=7)
-
-                else:
-                    # e.g. GRG0OPSFIN_20232620000_01D_01D_SOL.SNX.gz
-                    # AAA0OPSSNX_YYYYDDDHHMM_LEN_SMP_CNT.FMT.gz
-                    center = filename[0:3]  # e.g. "COD"
-                    project = filename[4:7]  # e.g. "OPS" or "RNN" unused
-                    _type = filename[7:10]  # e.g. "FIN"
-                    year = int(filename[11:15])  # e.g. "2023"
-                    day_of_year = int(filename[15:18])  # e.g. "262"
-                    hour = int(filename[18:20])  # e.g. "00"
-                    minute = int(filename[20:22])  # e.g. "00"
-                    intended_period = filename[23:26]  # eg "01D"
-                    sampling_resolution = filename[27:30]  # eg "01D"
-                    content = filename[31:34]  # e.g. "SOL"
-                    _format = filename[35:38]  # e.g. "SNX"
-
-                    date = datetime(year, 1, 1, hour, minute) + timedelta(day_of_year - 1)
-                    period = timedelta(days=int(intended_period[:-1]))  # Assuming all periods are in days :shrug:
-
-                if _format in target_files and start_time <= date <= end_time:
-                    products.loc[len(products)] = {
-                        "analysis_center": center,
-                        "project": project,
-                        "date": date,
-                        "solution_type": _type,
-                        "period": period,
-                        "resolution": sampling_resolution,
-                        "content": content,
-                        "format": _format
-                    }
-            except (ValueError, IndexError):
-                # Skips md5 sums and other non-conforming files
-                continue
-    products = products.drop_duplicates(inplace=False)  # resets indexes too
+        if gps_week < 2237:
+            # Format convention changed in week 2237
+            week = _parse_short_filenames(filenames, gps_week)
+        else:
+            week = _parse_long_filenames(filenames)
+
+        weeks.append(week[week["format"].isin(target_files) & week["date"].between(start_time, end_time)])
+
+    weeks = [week for week in weeks if not week.empty]
+    if not weeks:
+        return pd.DataFrame(columns=PRODUCT_COLUMNS)
+    products = pd.concat(weeks, ignore_index=True).drop_duplicates()
     return products
 
 
+def _week_filenames(gps_week: int) -> list[str]:
+    """
+    Lists the product filenames in a CDDIS GPS week directory. Listings are cached on disk (LISTING_CACHE_PATH),
+    listings taken once the week had settled are reused indefinitely, others (the week may still receive products)
+    for LISTING_TTL.
+
+    :param gps_week: GPS week
+    :returns: product filenames in listing order
+    :raises requests.RequestException: Failed to fetch the listing
+    """
+    cache_file = LISTING_CACHE_PATH / f"cddis_week_{gps_week}.json"
+    if cache_file.exists():
+        written = datetime.fromtimestamp(cache_file.stat().st_mtime)
+        # Only a listing taken after the week settled is complete, earlier ones may lack late (e.g. FIN) products
+        settled = written >= gpswk_to_date(gps_week + 1 + LISTING_SETTLED_WEEKS)
+        if settled or datetime.now() - written < LISTING_TTL:
+            try:
+                return json.loads(cache_file.read_text())
+            except ValueError:
+                pass  # Unreadable cache, fetch again
+
+    url = f"{BASE_URL}/gnss/products/{gps_week}/"
+    try:
+        week_files = get_session().get(url, timeout=10)
+        week_files.raise_for_status()
+    except requests.RequestException as e:
+        raise requests.RequestException(f"Failed to fetch files for GPS week {gps_week}: {e}")
+
+    # Single regex pass over the listing, each filename appears in both the link and its text
+    filenames = list(dict.fromkeys(match.decode() for match in PRODUCT_FILENAME_RE.findall(week_files.content)))
+
+    # Written in one go to a temporary file then swapped in, so concurrent/interrupted scans never leave a partial cache
+    LISTING_CACHE_PATH.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_file.write_text(json.dumps(filenames))
+    os.replace(tmp_file, cache_file)
+    return filenames
+
+
+def _parse_short_filenames(filenames: list[str], gps_week: int) -> pd.DataFrame:
+    """
+    Parses product filenames using the pre week 2237 convention in one vectorised pass. Non-conforming filenames
+    (e.g. md5 sums) are dropped.
+
+    e.g. cod22360.snx.Z
+    AAAWWWWD.TYP.Z
+
+    :param filenames: product filenames
+    :param gps_week: GPS week the files were listed under
+    :returns: dataframe of products, see get_product_dataframe()
+    """
+    names = pd.Series(filenames, dtype=object)
+    day = pd.to_numeric(names.str[7], errors="coerce")  # e.g. "0", 0-indexed, 7 indicates weekly
+    daily = (day > 0) & (day < 7)
+    products = pd.DataFrame({
+        "analysis_center": names.str[0:3].str.upper(),  # e.g. "COD"
+        "project": "OPS",
+        "date": pd.Timestamp(gpswk_to_date(gps_week)) + pd.to_timedelta(day.where(daily, 0), unit="D"),
+        "solution_type": "FIN",  # pre-2237 were probably always final solutions :shrug:
+        "period": pd.to_timedelta(daily.map({True: 1, False: 7}), unit="D"),
+        "resolution": None,
+        "content": None,
+        "format": names.str[9:12].str.upper(),  # e.g. "snx", "ssc", "sum", "erp"
+    }, columns=PRODUCT_COLUMNS)
+    return products[day.notna()]
+
+
+def _parse_long_filenames(filenames: list[str]) -> pd.DataFrame:
+    """
+    Parses product filenames using the post week 2237 convention in one vectorised pass. Timestamps are converted by
+    pd.to_datetime rather than per filename. Non-conforming filenames (e.g. md5 sums) are dropped.
+
+    e.g. GRG0OPSFIN_20232620000_01D_01D_SOL.SNX.gz
+    AAA0OPSSNX_YYYYDDDHHMM_LEN_SMP_CNT.FMT.gz
+
+    :param filenames: product filenames
+    :returns: dataframe of products, see get_product_dataframe()
+    """
+    names = pd.Series(filenames, dtype=object)
+    products = pd.DataFrame({
+        "analysis_center": names.str[0:3],  # e.g. "COD"
+        "project": names.str[4:7],  # e.g. "OPS" or "RNN" unused
+        "date": pd.to_datetime(names.str[11:22], format="%Y%j%H%M", errors="coerce"),  # e.g. "20232620000"
+        "solution_type": names.str[7:10],  # e.g. "FIN"
+        # e.g. "01D", assuming all periods are in days :shrug:
+        "period": pd.to_timedelta(pd.to_numeric(names.str[23:25], errors="coerce"), unit="D"),
+        "resolution": names.str[27:30],  # e.g. "01D"
+        "content": names.str[31:34],  # e.g. "SOL"
+        "format": names.str[35:38],  # e.g. "SNX"
+    }, columns=PRODUCT_COLUMNS)
+    return products.dropna(subset=["date", "period"])
+
+
 def get_valid_analysis_centers(data: pd.DataFrame) -> set[str]:
     """
     Analyzes dataframe for valid analysis centers (those that provide contiguous coverage)
@@ -155,49 +232,115 @@ def get_valid_analysis_centers(data: pd.DataFrame) -> set[str]:
         group = group.sort_values("date").reset_index(drop=True)
         for i in range(len(group) - 1):
             if group.loc[i]["date"] + group.loc[i]["period"] < group.loc[i + 1]["date"]:
-                print(
+                logger.info(
                     f"Gap detected for {center} {_type} {_format} between {group.loc[i, 'date']} and {group.loc[i + 1, 'date']}")
                 data = data[
                     data["analysis_center"] != center and data["solution_type"] != _type and data["format"] != _format]
 
     # 4. Report results
-    centers = set()
-    for analysis_center in data["analysis_center"].unique():
-        centers.add(analysis_center)
-        center_products = data.loc[data["analysis_center"] == analysis_center]
-        center_products = center_products.drop_duplicates(subset=["solution_type", "format"], inplace=False)
-        offerings = ""
-        for _format in center_products["format"].unique():
-            types = center_products.loc[center_products["format"] == _format, "solution_type"].unique()
-            offerings += f"{_format}:({'/'.join(types)}) "
-        print(f"[Handler] {analysis_center} offers: {offerings}")
+    centers = set(data["analysis_center"].unique())
+    # One group-by over the data, in order of first appearance, e.g. COD -> SP3:(FIN/RAP) CLK:(FIN)
+    offerings = (data.drop_duplicates(subset=["analysis_center", "format", "solution_type"])
+                 .groupby(["analysis_center", "format"], sort=False)["solution_type"]
+                 .agg("/".join)
+                 .reset_index())
+    for analysis_center, center_offerings in offerings.groupby("analysis_center", sort=False):
+        offered = "".join(f"{row.format}:({row.solution_type}) " for row in center_offerings.itertuples())
+        logger.info(f"[Handler] {analysis_center} offers: {offered}")
 
     return centers
 
 
+def _new_session() -> requests.Session:
+    """
+    :returns: requests Session with an enlarged connection pool that automatically retries failed connections and
+    transient server errors. Interrupted transfers are still resumed by download_file()
+    """
+    retries = Retry(total=MAX_RETRIES, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retries)
+    session = requests.Session()
+    session.headers["User-Agent"] = "Ginan-UI"
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _new_session()  # Shared by all unauthenticated requests, see get_session()
+_CDDIS_SESSION = _new_session()  # Shared by all authenticated CDDIS downloads, see get_cddis_session()
+
+
+def get_session() -> requests.Session:
+    """
+    :returns: module-wide requests Session (without credentials) so repeated requests to the same hosts reuse pooled
+    TCP/TLS connections
+    """
+    return _SESSION
+
+
+def get_cddis_session() -> requests.Session:
+    """
+    :returns: module-wide requests Session authenticated for CDDIS, so connections stay pooled across
+    download_products() calls. Credentials are re-read (cached until .netrc changes) on every call to pick up edits
+    """
+    _CDDIS_SESSION.auth = get_netrc_auth()
+    return _CDDIS_SESSION
+
+
 def extract_file(filepath: Path) -> Path:
     """
-    Extracts [".gz", ".gzip", ".Z"] files with gzip and unlzw3 respectively.
+    Extracts [".gz", ".gzip", ".Z"] files with gzip and _decompress_lzw() respectively.
     Deletes compressed file after extraction.
 
     :param filepath: compressed file path
     :return: path to extracted file
     """
-    finalpath = ".".join(str(filepath).split(".")[:-1])
-    if str(filepath.name).endswith((".gz", ".gzip")):
-        with gzip.open(filepath, "rb") as f_in, open(finalpath, "wb") as f_out:
-            shutil.copyfileobj(f_in, f_out)
-    elif str(filepath.name).endswith(".Z"):
-        decompressed_data = unlzw3.unlzw(filepath)
-        with open(finalpath, "wb") as f_out:
-            f_out.write(decompressed_data)
+    finalpath = filepath.with_suffix('')  # Remove compression suffix
+    if filepath.suffix in (".gz", ".gzip"):
+        with open(filepath, "rb") as raw, open(finalpath, "wb") as f_out:
+            if hasattr(os, "posix_fadvise"):  # Not on Windows/macOS
+                # Read once front to back, lets the kernel read ahead more aggressively
+                os.posix_fadvise(raw.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            with gzip.GzipFile(fileobj=raw, mode="rb") as f_in:
+                shutil.copyfileobj(f_in, f_out, EXTRACT_CHUNK_SIZE)
+    elif filepath.suffix == ".Z":
+        _decompress_lzw(filepath, finalpath)
     filepath.unlink()
-    return Path(finalpath)
+    return finalpath
+
+
+def _decompress_lzw(src: Path, dst: Path):
+    """
+    Decompresses a unix compress (.Z) file. Prefers compiled decoders over the pure-Python unlzw3:
+    ncompress (optional C extension, streamed), then "gunzip -c", then unlzw3 (whole file in memory).
+
+    :param src: .Z file path
+    :param dst: path to write decompressed data to
+    """
+    try:
+        import ncompress
+        with open(src, "rb") as f_in, open(dst, "wb") as f_out:
+            ncompress.decompress(f_in, f_out)
+        return
+    except ImportError:
+        pass
+
+    gunzip = shutil.which("gunzip")
+    if gunzip:
+        with open(dst, "wb") as f_out:
+            result = subprocess.run([gunzip, "-c", str(src)], stdout=f_out, stderr=subprocess.DEVNULL)
+        if result.returncode == 0:
+            return
+
+    # Last resort, only imported when the faster decoders are unavailable
+    import unlzw3
+    with open(dst, "wb") as f_out:
+        f_out.write(unlzw3.unlzw(src))
 
 
 def download_file(url: str, session: requests.Session, download_dir: Path = INPUT_PRODUCTS_PATH,
                   log_callback=None, progress_callback: Optional[Callable] = None,
-                  stop_requested: Callable = None) -> Path:
+                  stop_requested: Callable = None, existing: Optional[set[str]] = None,
+                  revalidate: bool = False) -> Path:
     """
     Checks if file already exists (additionally in compressed or .part forms).
     Uses provided session for CDDIS files (session made during startup).
@@ -207,45 +350,70 @@ def download_file(url: str, session: requests.Session, download_dir: Path = INPU
 
     :param url: download url
     :param session: requests Session preloaded with users CDDIS credentials
-    :param download_dir: dir to download to
+    :param download_dir: dir to download to, must already exist
     :param log_callback: called for log statements
-    :param progress_callback: reports, on every chunk, an int percentage of total download
+    :param progress_callback: reports an int percentage of total download, every 1% or 1 MiB (whichever is larger)
     :param stop_requested: bool callback. Raises a RuntimeError if occurred during download
+    :param existing: Optional snapshot of file paths (as str) in download_dir, see _scan_existing(). Used instead of
+    checking the filesystem for already downloaded files
+    :param revalidate: Re-download an existing file if the server has a newer version. Uses a conditional GET
+    (If-Modified-Since, plus If-None-Match from a <filename>.etag sidecar) so an unchanged file costs one round trip.
+    Skipped entirely within REVALIDATE_AFTER of the last check or download. The local copy is kept if the server can't
+    be reached
     :raises RuntimeError: Stop requested during download
     :raises Exception: Max retries reached
     :return:
     """
 
     def log(msg: str):
-        log_callback(msg) if log_callback else print(msg)
+        log_callback(msg) if log_callback else logger.info(msg)
+
+    def exists(path: Path) -> bool:
+        return str(path) in existing if existing is not None else path.exists()
 
     filepath = Path(download_dir / url.split("/")[-1])  # Download dir + filename
-    # 1. When file already exists, extract if possible, then return
-    if filepath.exists():
-        if filepath.suffix in COMPRESSED_FILETYPE:
-            return extract_file(filepath)
-        else:
-            return filepath
+    local_copy = filepath.with_suffix('') if filepath.suffix in COMPRESSED_FILETYPE else filepath
+    etag_path = filepath.with_name(filepath.name + ".etag")
+    _partial = filepath.with_suffix(filepath.suffix + ".part")
+    conditional_headers = {}
+
+    if revalidate and exists(local_copy):
+        # 0. Ask the server whether the local copy is outdated instead of returning it, unless it was checked recently
+        if datetime.now().timestamp() - local_copy.stat().st_mtime < REVALIDATE_AFTER.total_seconds():
+            return local_copy
+        conditional_headers["If-Modified-Since"] = formatdate(local_copy.stat().st_mtime, usegmt=True)
+        if etag_path.exists():
+            conditional_headers["If-None-Match"] = etag_path.read_text().strip()
+        _partial.unlink(missing_ok=True)  # May belong to an older version
+
+    else:
+        # 1. When file already exists, extract if possible, then return
+        if exists(filepath):
+            if filepath.suffix in COMPRESSED_FILETYPE:
+                return extract_file(filepath)
+            else:
+                return filepath
 
-    # 2. Check if an extracted version of this file already exists
-    if filepath.suffix in COMPRESSED_FILETYPE:
-        potential_decompressed = filepath.with_suffix('')  # Remove one suffix
-        if potential_decompressed.exists():
-            return potential_decompressed
+        # 2. Check if an extracted version of this file already exists
+        if filepath.suffix in COMPRESSED_FILETYPE:
+            potential_decompressed = filepath.with_suffix('')  # Remove one suffix
+            if exists(potential_decompressed):
+                return potential_decompressed
 
     # 3. Download the file in chunks (.part)
     for i in range(MAX_RETRIES):
-        _partial = filepath.with_suffix(filepath.suffix + ".part")
-
+        resume_offset = _partial.stat().st_size if _partial.exists() else 0
+        # Byte counts must match Content-Length for progress, resume offsets and the completeness check,
+        # a transparently decoded Content-Encoding: gzip response would not
         if _partial.exists():
             # Resume partial downloads
-            headers = {"Range": f"bytes={_partial.stat().st_size}-"}
-            log(f"Resuming download of {filepath.name} from byte {_partial.stat().st_size}")
+            headers = {"Range": f"bytes={resume_offset}-", "Accept-Encoding": "identity"}
+            log(f"Resuming download of {filepath.name} from byte {resume_offset}")
         else:
             # Download whole file
-            headers = {"Range": "bytes=0-"}
-            log(f"Starting new download of {filepath.name}")
-            os.makedirs(_partial.parent, exist_ok=True)
+            headers = {"Range": "bytes=0-", "Accept-Encoding": "identity", **conditional_headers}
+            log(f"Checking {local_copy.name} for updates" if conditional_headers
+                else f"Starting new download of {filepath.name}")
 
             # Hack?! for windows error when open(_partial, "wb") not creating new files
             ensure_file_exists = open(_partial, "w")
@@ -254,22 +422,34 @@ def download_file(url: str, session: requests.Session, download_dir: Path = INPU
         try:
             if url.startswith(BASE_URL):
                 # Download files from CDDIS with authorized session
-                resp = session.get(url, headers=headers, stream=True, timeout=30)
+                resp = session.get(url, headers=headers, stream=True, timeout=TIMEOUT)
             else:
-                resp = requests.get(url, headers=headers, stream=True, timeout=30)
+                resp = get_session().get(url, headers=headers, stream=True, timeout=TIMEOUT)
+
+            if resp.status_code == 304:
+                # Not modified, local copy is current
+                resp.close()
+                _partial.unlink(missing_ok=True)
+                os.utime(local_copy)  # Restarts the REVALIDATE_AFTER window
+                log(f"{local_copy.name} is up to date")
+                return local_copy
             resp.raise_for_status()
 
             if resp.status_code == 206:
                 # Received partial content as expected
-                mode = 'ab' if _partial.exists() else 'wb'
-                total_size = int(resp.headers.get("content-length")) + _partial.stat().st_size
+                mode = 'ab'
+                downloaded = resume_offset
+                total_size = int(resp.headers.get("content-length")) + resume_offset
             else:
                 # likely 200 OK, server is sending the entire file again
                 mode = 'wb'
+                downloaded = 0
                 total_size = int(resp.headers.get("content-length"))
 
-            with open(_partial, mode) as partial_out:
-                downloaded = _partial.stat().st_size
+            # Report progress every 1% or 1 MiB, whichever is larger, rather than every chunk
+            report_interval = max(total_size // 100, PROGRESS_INTERVAL)
+            last_report = downloaded
+            with open(_partial, mode, buffering=WRITE_BUFFER_SIZE) as partial_out:
                 for _chunk in resp.iter_content(chunk_size=CHUNK_SIZE):
                     if stop_requested and stop_requested():
                         raise RuntimeError("Stop requested during download.")
@@ -278,17 +458,29 @@ def download_file(url: str, session: requests.Session, download_dir: Path = INPU
                         partial_out.write(_chunk)
                         downloaded += len(_chunk)
 
-                        if progress_callback:
+                        if progress_callback and (downloaded - last_report >= report_interval
+                                                  or downloaded >= total_size):
+                            last_report = downloaded
                             percent = int(downloaded / total_size * 100)
                             progress_callback(filepath.name, percent)
 
-            os.rename(_partial, filepath)
+            if downloaded < total_size:
+                # Stream ended early, keep the .part file and resume it in the next attempt
+                log(f"Incomplete download of {filepath.name} ({downloaded}/{total_size} bytes)")
+                continue
+
+            os.replace(_partial, filepath)  # Atomic, and unlike os.rename also overwrites on Windows
+            if revalidate and resp.headers.get("ETag"):
+                etag_path.write_text(resp.headers["ETag"])
 
             if filepath.suffix in COMPRESSED_FILETYPE:
                 return extract_file(filepath)
             else:
                 return filepath
         except requests.RequestException as e:
+            if conditional_headers:
+                log(f"Couldn't check {local_copy.name} for updates, using existing copy: {e}")
+                return local_copy
             log(f"Failed attempt {i} to download {filepath.name}: {e}")
 
     raise (Exception(f"Failed to download {filepath.name} after {MAX_RETRIES} attempts"))
@@ -302,95 +494,241 @@ def get_brdc_urls(start_time: datetime, end_time: datetime) -> list[str]:
     :param end_time: End of the date range
     :returns: List URLs to download BRDC files
     """
-    urls = []
-    reference_dt = start_time
-    while int((end_time - reference_dt).total_seconds()) > 0:
-        day = reference_dt.strftime("%j")
-        filename = f"BRDC00IGS_R_{reference_dt.year}{day}0000_01D_MN.rnx.gz"
-        url = f"{BASE_URL}/gnss/data/daily/{reference_dt.year}/brdc/{filename}"
-        urls.append(url)
-        reference_dt += timedelta(days=1)
-    return urls
+    return list(_brdc_urls(start_time, end_time))  # Fresh list, callers may extend it
+
+
+@lru_cache(maxsize=32)
+def _brdc_urls(start_time: datetime, end_time: datetime) -> tuple[str, ...]:
+    # URLs depend only on the dates, so repeat downloads for the same epochs reuse them
+    if end_time <= start_time:
+        return ()  # date_range(inclusive="left") would still yield start_time for an empty window
+    # One entry per day from start_time, excluding end_time itself
+    days = pd.date_range(start_time, end_time, freq="D", inclusive="left")
+    filenames = "BRDC00IGS_R_" + days.strftime("%Y%j") + "0000_01D_MN.rnx.gz"
+    urls = BASE_URL + "/gnss/data/daily/" + days.strftime("%Y") + "/brdc/" + filenames
+    return tuple(urls)
 
 
 def download_metadata(download_dir: Path = INPUT_PRODUCTS_PATH, log_callback=None,
-                      progress_callback: Optional[Callable] = None, atx_callback: Optional[Callable] = None):
+                      progress_callback: Optional[Callable] = None, atx_callback: Optional[Callable] = None,
+                      stop_requested: Optional[Callable] = None):
     """
     Calls download_products() with args to download standard metadata files. Calls atx_callback("igs20.atx")
-    once "igs20.atx" is downloaded. Won't install duplicate files.
+    once "igs20.atx" is downloaded. Won't install duplicate files, but refreshes any file the server has published a
+    newer version of (conditional GET, at most once per REVALIDATE_AFTER).
 
     :param download_dir: dir to download to
     :param log_callback: called for log statements
-    :param progress_callback: reports, on every chunk, an int percentage of total download
+    :param progress_callback: reports (filename, int percentage) of each download, every 1% or 1 MiB (whichever is
+    larger), see download_file()
     :param atx_callback: Optional callback function when igs20.atx is downloaded (downloaded_file)
+    :param stop_requested: bool callback. Raises a RuntimeError if occurred during download
+    :raises RuntimeError: Stop requested during download
     :raises Exception: Max retries reached
     """
     for download in download_products(products=pd.DataFrame(), download_dir=download_dir, log_callback=log_callback,
-                                      progress_callback=progress_callback, dl_urls=METADATA):
+                                      progress_callback=progress_callback, dl_urls=METADATA,
+                                      stop_requested=stop_requested, max_workers=METADATA_WORKERS,
+                                      revalidate=METADATA):
         if atx_callback and download.name == "igs20.atx":
             atx_callback(download.name)
 
 
 def download_products(products: pd.DataFrame, download_dir: Path = INPUT_PRODUCTS_PATH,
                       log_callback: Optional[Callable] = None, dl_urls: list = None, progress_callback: Optional[Callable] = None,
-                      stop_requested: Optional[Callable] = None) -> Generator[Path, None, None]:
+                      stop_requested: Optional[Callable] = None, max_workers: int = 1,
+                      revalidate: Iterable[str] = ()) -> Generator[Path, None, None]:
     """
     Creates download URLs for products and subsequently calls download_file() on them. Won't install duplicate files.
+    With max_workers > 1 files are downloaded concurrently and yielded in order of completion.
 
     :param pd.DataFrame products: (from get_product_dataframe) of all products to download
     :param download_dir: dir to download to
     :param log_callback: called for log statements
-    :param dl_urls: Optional list of additional URLs to download (e.g. BRDC files)
-    :param progress_callback: reports, on every chunk, an int percentage of total download
+    :param dl_urls: Optional list/tuple of additional URLs to download (e.g. BRDC files, METADATA)
+    :param progress_callback: reports (filename, int percentage) of each download, every 1% or 1 MiB (whichever is
+    larger), see download_file()
     :param stop_requested: bool callback. Raises a RuntimeError if occurred during download
+    :param max_workers: number of files to download at once
+    :param revalidate: URLs to re-download if already installed but outdated, see download_file()
     :returns: Generator with paths to downloaded files
     :raises RuntimeError: Stop requested during download
     :raises Exception: Max retries reached
     """
 
     def log(msg: str):
-        log_callback(msg) if log_callback else print(msg)
+        log_callback(msg) if log_callback else logger.info(msg)
 
     # 1. Generate filenames from the DataFrame
-    downloads = []
-    for _, row in products.iterrows():
-        gps_week = date_to_gpswk(row.date)
-        if gps_week < 2237:
-            # AAAWWWWD.TYP.Z
-            # e.g. COD22360.FIN.SNX.gz
-            if row.period == timedelta(days=7):
-                day = 7
-            else:
-                day = int((row.date - gpswk_to_date(gps_week)).days)
-            filename = f"{row.analysis_center.lower()}{gps_week}{day}.{row.format.lower()}.Z"
-        else:
-            # e.g. GRG0OPSFIN_20232620000_01D_01D_SOL.SNX.gz
-            # AAA0OPSSNX_YYYYDDDHHMM_LEN_SMP_CNT.FMT.gz
-            filename = f"{row.analysis_center}0{row.project}{row.solution_type}_{row.date.strftime('%Y%j%H%M')}_{row.period.days:02d}D_{row.resolution}_{row.content}.{row.format}.gz"
-
-        url = f"{BASE_URL}/gnss/products/{gps_week}/{filename}"
-        downloads.append(url)
+    downloads = _product_urls(products)
 
     if dl_urls:
         downloads.extend(dl_urls)
+    unique = list(dict.fromkeys(downloads))  # Removes duplicates, preserves order
+    if len(unique) < len(downloads):
+        logger.warning(f"Skipping {len(downloads) - len(unique)} duplicate download URL(s)")
+    downloads = unique
 
     log(f"📦 {len(downloads)} files to check or download")
-    download_dir.mkdir(parents=True, exist_ok=True)
-    (download_dir / "tables").mkdir(parents=True, exist_ok=True)
-    _sesh = requests.Session()
-    _sesh.auth = get_netrc_auth()
-    for url in downloads:
-        _x = url.split("/")
-        if len(_x) < 2:
-            fin_dir = download_dir
-        else:
-            fin_dir = download_dir / "tables" if _x[-2] == "tables" else download_dir
-        yield download_file(url, _sesh, fin_dir, log_callback, progress_callback, stop_requested)
+    targets = [(url, _resolve_dir(url, download_dir)) for url in downloads]
+    target_dirs = {target_dir for _, target_dir in targets}
+    for target_dir in target_dirs:
+        target_dir.mkdir(parents=True, exist_ok=True)
+    existing = _scan_existing(target_dirs)
+
+    revalidate = set(revalidate)
+    _sesh = get_cddis_session()
+    _warm_connections([url for url, fin_dir in targets if not _installed(url, fin_dir, existing)], _sesh)
+    if max_workers <= 1 or len(targets) <= 1:
+        for url, fin_dir in targets:
+            yield download_file(url, _sesh, fin_dir, log_callback, progress_callback, stop_requested, existing,
+                                url in revalidate)
+        return
+
+    # Downloads are network bound, threads overlap their latency (requests.Session is safe for concurrent GETs)
+    workers = min(max_workers, len(targets))
+    slots = threading.Semaphore(workers)  # Only submit once a worker is free, so a stop leaves nothing queued
+    done = queue.SimpleQueue()
+
+    def _on_done(future):
+        slots.release()
+        done.put(future)
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending = 0
+    try:
+        for url, fin_dir in targets:
+            slots.acquire()
+            # Yield whatever finished while waiting for the slot
+            while not done.empty():
+                pending -= 1
+                yield done.get().result()
+            if stop_requested and stop_requested():
+                raise RuntimeError("Stop requested during download.")
+
+            future = executor.submit(download_file, url, _sesh, fin_dir, log_callback, progress_callback,
+                                     stop_requested, existing, url in revalidate)
+            future.add_done_callback(_on_done)
+            pending += 1
+
+        while pending:
+            pending -= 1
+            yield done.get().result()
+    finally:
+        # On failure, stop or an abandoned generator, don't start downloads that are still queued
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _installed(url: str, download_dir: Path, existing: set[str]) -> bool:
+    """
+    :returns: whether download_file() would find url's file (or its extracted form) already in download_dir
+    """
+    filepath = download_dir / url.split("/")[-1]
+    local_copy = filepath.with_suffix('') if filepath.suffix in COMPRESSED_FILETYPE else filepath
+    return str(filepath) in existing or str(local_copy) in existing
+
+
+def _warm_connections(urls: list[str], cddis_session: requests.Session):
+    """
+    Opens a pooled connection to every host in urls concurrently, so DNS lookups and TCP/TLS handshakes overlap
+    rather than each host's first download paying for them in turn. Best effort, failures are left to the downloads.
+
+    :param urls: URLs about to be downloaded
+    :param cddis_session: authenticated session used for CDDIS URLs, see download_file()
+    """
+    hosts = {}
+    for url in urls:
+        parts = urlsplit(url)
+        hosts.setdefault(f"{parts.scheme}://{parts.netloc}/", cddis_session if url.startswith(BASE_URL) else get_session())
+    if len(hosts) <= 1:
+        return  # A single host's handshake happens on its first download anyway
+
+    def _head(root: str, session: requests.Session):
+        # Mirrors HTTPAdapter.send() (same pool key, TLS and proxy settings) so the connection is kept for the
+        # downloads, but without its Retry: an unresponsive host costs one short attempt rather than holding up the
+        # batch through retries and backoff
+        request = session.prepare_request(requests.Request("HEAD", root))
+        settings = session.merge_environment_settings(request.url, {}, None, None, None)
+        adapter = session.get_adapter(request.url)
+        try:
+            pool = adapter.get_connection_with_tls_context(request, settings["verify"], proxies=settings["proxies"],
+                                                           cert=settings["cert"])
+            adapter.cert_verify(pool, request.url, settings["verify"], settings["cert"])
+            pool.urlopen("HEAD", adapter.request_url(request, settings["proxies"]), headers=request.headers,
+                         redirect=False, assert_same_host=False, retries=False, timeout=Timeout(connect=3, read=5))
+        except (requests.RequestException, Urllib3Error, OSError, ValueError):
+            pass
+
+    with ThreadPoolExecutor(max_workers=len(hosts)) as executor:
+        list(executor.map(_head, hosts.keys(), hosts.values()))
+
+
+def _scan_existing(directories) -> set[str]:
+    """
+    Lists each directory once, rather than checking every candidate file individually.
+
+    :param directories: iterable of directory Paths
+    :returns: set of file paths (as str) currently in the directories
+    """
+    existing = set()
+    for directory in directories:
+        with os.scandir(directory) as entries:
+            existing.update(entry.path for entry in entries)
+    return existing
+
+
+def _product_urls(products: pd.DataFrame) -> list[str]:
+    """
+    Builds the CDDIS download URL of every product (row) with vectorised string operations.
+
+    :param products: (from get_product_dataframe) products to download
+    :returns: list of URLs in the same order as products
+    """
+    if products.empty:
+        return []
+
+    dates = pd.to_datetime(products["date"])
+    periods = pd.to_timedelta(products["period"])
+    days_since_origin = (dates - GPS_ORIGIN).dt.days
+    gps_weeks = days_since_origin // 7
+    legacy = gps_weeks < 2237  # Format convention changed in week 2237
+
+    filenames = pd.Series(index=products.index, dtype=object)
+
+    # AAAWWWWD.TYP.Z
+    # e.g. cod22360.snx.Z, day 7 indicates weekly
+    old = products[legacy]
+    day = (days_since_origin[legacy] % 7).where(periods[legacy] != pd.Timedelta(days=7), 7)
+    filenames[legacy] = (old["analysis_center"].str.lower() + gps_weeks[legacy].astype(str) + day.astype(str) + "."
+                         + old["format"].str.lower() + ".Z")
+
+    # e.g. GRG0OPSFIN_20232620000_01D_01D_SOL.SNX.gz
+    # AAA0OPSSNX_YYYYDDDHHMM_LEN_SMP_CNT.FMT.gz
+    new = products[~legacy]
+    filenames[~legacy] = (new["analysis_center"] + "0" + new["project"] + new["solution_type"] + "_"
+                          + dates[~legacy].dt.strftime("%Y%j%H%M") + "_"
+                          + periods[~legacy].dt.days.map("{:02d}D".format) + "_"
+                          + new["resolution"] + "_" + new["content"] + "." + new["format"] + ".gz")
+
+    return (BASE_URL + "/gnss/products/" + gps_weeks.astype(str) + "/" + filenames).tolist()
+
+
+def _resolve_dir(url: str, download_dir: Path) -> Path:
+    """
+    :param url: download url
+    :param download_dir: base download dir
+    :returns: download_dir/tables for files served from a "tables" directory, otherwise download_dir
+    """
+    _x = url.split("/")
+    if len(_x) >= 2 and _x[-2] == "tables":
+        return download_dir / "tables"
+    return download_dir
 
 
 if __name__ == "__main__":
     # Test whole file download
-    sesh = requests.Session()
+    INPUT_PRODUCTS_PATH.mkdir(parents=True, exist_ok=True)
+    sesh = _new_session()
     sesh.auth = get_netrc_auth()
     x = Path(f"{INPUT_PRODUCTS_PATH}/COD0MGXFIN_20191950000_01D_01D_OSB.BIA.gz")
     if x.exists():
@@ -405,7 +743,7 @@ if __name__ == "__main__":
     # Test resuming a partial download
     os.remove(x.with_suffix(''))  # should extract file
     y = x.with_suffix(x.suffix + ".part")
-    req = sesh.get(f"{BASE_URL}/gnss/products/2062/{x.name}", headers={"Range": f"bytes=0-{CHUNK_SIZE}"}, stream=True)
+    req = sesh.get(f"{BASE_URL}/gnss/products/2062/{x.name}", headers={"Range": "bytes=0-8191"}, stream=True)
     with open(y, "wb") as z:
         for chunk in req.iter_content(chunk_size=CHUNK_SIZE):
             if chunk:  # Filters keep-alives
@@ -1,3 +1,4 @@
+import copy
 import os
 import platform
 import shutil
@@ -5,6 +6,7 @@ import subprocess
 import signal
 import threading
 import time
+from functools import lru_cache
 from importlib.resources import files
 
 from ruamel.yaml.scalarstring import PlainScalarString
@@ -44,6 +46,22 @@ def get_pea_exec():
     return executable
 
 
+@lru_cache(maxsize=8)
+def _load_yaml_cached(path_str: str, mtime_ns: int):
+    """
+    Parses a config once per (path, modification time). Callers must deepcopy the result before editing it.
+    """
+    return load_yaml(Path(path_str))
+
+
+def load_config(config_path: Path):
+    """
+    :param config_path: Path to a config file
+    :return: an independent copy of the parsed config, reusing a previous parse if the file is unchanged
+    """
+    return copy.deepcopy(_load_yaml_cached(str(config_path), config_path.stat().st_mtime_ns))
+
+
 class Execution:
     def __init__(self, config_path: Path = GENERATED_YAML):
         """
@@ -68,7 +86,7 @@ class Execution:
                 shutil.copy(template_file, config_path)
             except Exception as e:
                 raise RuntimeError(f"❌ Failed to copy default config: {e}")
-        self.config = load_yaml(config_path)
+        self.config = load_config(config_path)
 
     def reload_config(self):
         """
@@ -78,7 +96,7 @@ class Execution:
         :raises RuntimeError: Any error occurred during load_yaml(config_path)
         """
         try:
-            self.config = load_yaml(self.config_path)
+            self.config = load_config(self.config_path)
             print(f"[Execution] 🔁 Reloaded config from disk: {self.config_path}")
         except Exception as e:
             raise RuntimeError(f"❌ Failed to reload config from {self.config_path}: {e}")
@@ -169,17 +187,17 @@ class Execution:
         # Always format process_noise as a list
         self.edit_config("estimation_parameters.receivers.global.pos.process_noise", [inputs.mode], False)
 
-        # 4. GNSS constellation toggles
+        # 4. GNSS constellation toggles, enable only the selected constellations
         all_constellations = ["gps", "gal", "glo", "bds", "qzs"]
-        for const in all_constellations:
-            self.edit_config(f"processing_options.gnss_general.sys_options.{const}.process", False, False)
-
-        # Then enable only the selected constellations
+        selected = set()
         if inputs.constellations_raw:
-            selected = [c.strip().lower() for c in inputs.constellations_raw.split(",") if c.strip()]
-            for const in selected:
-                if const in all_constellations:
-                    self.edit_config(f"processing_options.gnss_general.sys_options.{const}.process", True, False)
+            selected = {c.strip().lower() for c in inputs.constellations_raw.split(",") if c.strip()}
+
+        sys_options = self.config["processing_options"]["gnss_general"]["sys_options"]
+        for const in all_constellations:
+            if "process" not in sys_options[const]:
+                raise KeyError(f"Key 'process' not found in processing_options.gnss_general.sys_options.{const}")
+            sys_options[const]["process"] = const in selected
 
     def write_cached_changes(self):
         write_yaml(self.config_path, self.config)
@@ -225,9 +243,8 @@ class Execution:
                             e.add_note("Error executing PEA command")
                             raise e
                         break
-
-                # slight sleep to avoid busy polling
-                time.sleep(0.01)
+                    # slight sleep to avoid busy polling, only while waiting for the process to exit
+                    time.sleep(0.01)
 
         finally:
             # after execution, clean up finished processes
@@ -1,6 +1,7 @@
 # app/utils/cddis_credentials.py
 from __future__ import annotations
 import os, platform, stat, shutil
+from functools import lru_cache
 from pathlib import Path
 import netrc
 
@@ -74,6 +75,27 @@ def save_earthdata_credentials(username: str, password: str) -> tuple[Path, ...]
     os.environ["NETRC"] = str(written[0])
     return tuple(written)
 
+@lru_cache(maxsize=8)
+def _parse_netrc_cached(path: str, mtime_ns: int) -> netrc.netrc:
+    # mtime_ns is only part of the cache key, so rewriting the file invalidates the entry
+    return netrc.netrc(path)
+
+def parse_netrc(p: Path) -> netrc.netrc:
+    """
+    Parse a `.netrc`-style file, reusing the previous result while the file is unchanged.
+
+    Arguments:
+      p (Path): Credential file path (must exist).
+
+    Returns:
+      netrc.netrc: Parsed credentials. Shared between callers, treat as read-only.
+
+    Example:
+      >>> parse_netrc(netrc_candidates()[0]) is parse_netrc(netrc_candidates()[0])  # doctest: +SKIP
+      True
+    """
+    return _parse_netrc_cached(str(p), p.stat().st_mtime_ns)
+
 def _ensure_windows_mirror() -> None:
     """
     Ensure .netrc exists by mirroring _netrc on Windows if necessary.
@@ -108,7 +130,7 @@ def validate_netrc(required=(URS, CDDIS)) -> tuple[bool, str]:
     if not p.exists():
         return False, f"not found: {p}"
     try:
-        n = netrc.netrc(p)
+        n = parse_netrc(p)
         for host in required:
             auth = n.authenticators(host)
             if not auth or not auth[0] or not auth[2]:
@@ -18,9 +18,10 @@ import platform
 import time
 from pathlib import Path
 from typing import Tuple
-import netrc
 import requests
 
+from app.utils.cddis_credentials import parse_netrc
+
 ENV_FILE = Path(__file__).resolve().parent / "CDDIS.env"
 EMAIL_KEY = "EMAIL"
 
@@ -126,7 +127,7 @@ def get_username_from_netrc(prefer_host: str = "urs.earthdata.nasa.gov") -> Tupl
     if not p.exists():
         return False, f"no netrc at {p}"
     try:
-        n = netrc.netrc(p)
+        n = parse_netrc(p)
         auth = n.authenticators(prefer_host) or n.authenticators("cddis.nasa.gov")
         if not auth or not auth[0]:
             return False, f"no authenticators for {prefer_host} or cddis.nasa.gov in {p}"
@@ -174,7 +175,7 @@ def get_netrc_auth() -> tuple[str, str] | None:
     p = _pick_netrc()
     if not p.exists():
         return None
-    n = netrc.netrc(p)
+    n = parse_netrc(p)
     for host in ("cddis.nasa.gov", "urs.earthdata.nasa.gov"):
         auth = n.authenticators(host)
         if auth and auth[0] and auth[2]:
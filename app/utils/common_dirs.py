@@ -3,3 +3,4 @@ from pathlib import Path
 TEMPLATE_PATH = Path(__file__).parent.parent / "resources" / "Yaml" / "default_config.yaml"
 GENERATED_YAML = Path(__file__).parent.parent / "resources" / "ppp_generated.yaml"
 INPUT_PRODUCTS_PATH = Path(__file__).parent.parent / "resources" / "inputData" / "products"
+LISTING_CACHE_PATH = Path(__file__).parent.parent / "resources" / "cache"
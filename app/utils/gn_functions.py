@@ -14,7 +14,6 @@ from urllib import request as _request
 from urllib.error import HTTPError as _HTTPError
 
 import numpy as _np
-import hatanaka as _hatanaka
 
 GPS_ORIGIN = _np.datetime64("1980-01-06 00:00:00")
 
@@ -189,6 +188,7 @@ def decompress_file(input_filepath: _Path, delete_after_decompression: bool = Fa
     if extension == ".gz":
         # Special case for the extraction of RNX / CRX files (uses hatanaka module)
         if input_file.stem[-4:] in [".rnx", ".crx"]:
+            import hatanaka as _hatanaka  # Deferred, only RINEX decompression needs it
             output_file = _hatanaka.decompress_on_disk(path=input_file, delete=delete_after_decompression).resolve()
             return output_file
         # Output file definition:
@@ -220,6 +220,7 @@ def decompress_file(input_filepath: _Path, delete_after_decompression: bool = Fa
         if input_file.stem[-1] not in ["d", "n"]:  # RINEX 2 files: "d" observation data, "n" broadcast ephemerides
             logging.info(f"Only decompression of RINEX files currently supported for .Z decompression")
             return None
+        import hatanaka as _hatanaka
         output_file = _hatanaka.decompress_on_disk(path=input_file, delete=delete_after_decompression).resolve()
         logging.debug(f"Decompression of {input_file.name} to {output_file.name} in {output_file.parent} complete")
         return output_file
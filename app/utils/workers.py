@@ -1,4 +1,7 @@
 # app/utils/workers.py
+import logging
+import threading
+import time
 import traceback
 from datetime import datetime
 from pathlib import Path
@@ -7,9 +10,29 @@ from typing import Optional
 import pandas as pd
 from PySide6.QtCore import QObject, Signal, Slot
 
-from app.models.dl_products import get_product_dataframe, download_products, get_brdc_urls, METADATA, download_metadata
+from app.models.dl_products import get_product_dataframe, download_products, get_brdc_urls, METADATA, download_metadata, \
+    PRODUCT_WORKERS
 from app.utils.common_dirs import INPUT_PRODUCTS_PATH
 
+__all__ = ["PeaExecutionWorker", "DownloadWorker", "format_error"]
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_EMIT_INTERVAL = 0.05  # seconds between progress signals per file (~20 updates/s)
+
+
+def format_error(error) -> str:
+    """
+    Formats a worker's error signal payload for display. Formatting happens in the receiving (GUI) slot, and only the
+    exception type, message and notes are shown, the full traceback is logged at debug level by the worker.
+
+    :param error: exception emitted by a worker's error signal (plain strings are passed through)
+    :returns: e.g. "CalledProcessError: Command '...' returned non-zero exit status 1."
+    """
+    if isinstance(error, BaseException):
+        return "".join(traceback.format_exception_only(type(error), error)).strip()
+    return str(error)
+
 
 class PeaExecutionWorker(QObject):
     """
@@ -19,7 +42,7 @@ class PeaExecutionWorker(QObject):
       - stop_all()  (optional but recommended: terminate underlying process)
     """
     finished = Signal(object)
-    error = Signal(str)
+    error = Signal(object)  # the exception itself, see format_error()
     log = Signal(str)
 
     def __init__(self, execution):
@@ -34,9 +57,10 @@ class PeaExecutionWorker(QObject):
             if hasattr(self.execution, "stop_all"):
                 self.execution.stop_all()
             self.finished.emit("[PeaExecutionWorker] Stopped.")
-        except Exception:
-            tb = traceback.format_exc()
-            self.error.emit(f"[PeaExecutionWorker] Exception during stop:\n{tb}")
+        except Exception as e:
+            # Traceback is only formatted when debug logging is enabled (main.py --debug)
+            logger.debug("[PeaExecutionWorker] Exception during stop", exc_info=True)
+            self.error.emit(e)
 
     @Slot()
     def run(self):
@@ -44,9 +68,9 @@ class PeaExecutionWorker(QObject):
             self.log.emit("[PeaExecutionWorker] Starting PEA execution...")
             self.execution.execute_config()
             self.finished.emit("[PeaExecutionWorker] Execution finished successfully.")
-        except Exception:
-            tb = traceback.format_exc()
-            self.error.emit(f"[PeaExecutionWorker] Exception:\n{tb}")
+        except Exception as e:
+            logger.debug("[PeaExecutionWorker] Exception", exc_info=True)
+            self.error.emit(e)
 
 
 class DownloadWorker(QObject):
@@ -60,7 +84,7 @@ class DownloadWorker(QObject):
     :param analysis_centers: Set to true to retrieve valid analysis centers, ensure start and end date specified
     """
     finished = Signal(object)
-    error = Signal(str)
+    error = Signal(object)  # the exception itself, see format_error()
     progress = Signal(str, int)
     log = Signal(str)
     atx_downloaded = Signal(str)
@@ -73,11 +97,26 @@ class DownloadWorker(QObject):
         self.start_epoch = start_epoch
         self.end_epoch = end_epoch
         self.analysis_centers = analysis_centers
-        self._stop = False
+        self._stop = threading.Event()  # Set from the GUI thread, polled by the download threads
 
     @Slot()
     def stop(self):
-        self._stop = True
+        self._stop.set()
+
+    def _throttled_progress(self):
+        """
+        :returns: progress callback that emits at most once per PROGRESS_EMIT_INTERVAL for each file (always at 100%),
+        so fast downloads don't flood the GUI event loop with queued signals
+        """
+        last_emit: dict[str, float] = {}  # Each file is only reported from its own download thread
+
+        def _progress_cb(filename: str, percent: int):
+            now = time.monotonic()
+            if percent >= 100 or now - last_emit.get(filename, 0.0) >= PROGRESS_EMIT_INTERVAL:
+                last_emit[filename] = now
+                self.progress.emit(filename, percent)
+
+        return _progress_cb
 
     @Slot()
     def run(self):
@@ -94,20 +133,21 @@ class DownloadWorker(QObject):
                 valid_products = get_product_dataframe(self.start_epoch, self.end_epoch)
                 self.finished.emit(valid_products)
             except Exception as e:
-                tb = traceback.format_exc()
-                self.log.emit(f"[PPPDownloadWorker] Error whilst retrieving valid products:\n{tb}")
-                self.error.emit(str(e))
+                logger.debug("[PPPDownloadWorker] Error whilst retrieving valid products", exc_info=True)
+                self.log.emit(f"[PPPDownloadWorker] Error whilst retrieving valid products: {e}")
+                self.error.emit(e)
             return
 
         # 2. Install metadata
         elif self.products.empty:
             self.log.emit("[PPPDownloadWorker] Checking pre-processing metadata installed")
             try:
-                download_metadata(self.download_dir, _log_cb, self.progress.emit, self.atx_downloaded.emit)
+                download_metadata(self.download_dir, _log_cb, self._throttled_progress(), self.atx_downloaded.emit,
+                                  self._stop.is_set)
             except Exception as e:
-                tb = traceback.format_exc()
-                self.log.emit(f"[PPPDownloadWorker] Error whilst downloading metadata:\n{tb}")
-                self.error.emit(str(e))
+                logger.debug("[PPPDownloadWorker] Error whilst downloading metadata", exc_info=True)
+                self.log.emit(f"[PPPDownloadWorker] Error whilst downloading metadata: {e}")
+                self.error.emit(e)
                 return
 
 
@@ -115,20 +155,19 @@ class DownloadWorker(QObject):
         else:
             self.log.emit("[PPPDownloadWorker] Downloading specified products")
             try:
-                def check_stop():
-                    return self._stop
-                # Disregard generator output
+                # Disregard generator output, PPP products and BRDC files download concurrently
                 for _ in download_products(self.products, download_dir=self.download_dir, log_callback=_log_cb,
                                   dl_urls=get_brdc_urls(self.start_epoch, self.end_epoch),
-                                  progress_callback=self.progress.emit, stop_requested=check_stop):
+                                  progress_callback=self._throttled_progress(), stop_requested=self._stop.is_set,
+                                  max_workers=PRODUCT_WORKERS):
                     pass
             except RuntimeError as e:
-                self.error.emit(str(e))
+                self.error.emit(e)
                 return
             except Exception as e:
-                tb = traceback.format_exc()
-                self.log.emit(f"[PPPDownloadWorker] Error whilst downloading products:\n{tb}")
-                self.error.emit(str(e))
+                logger.debug("[PPPDownloadWorker] Error whilst downloading products", exc_info=True)
+                self.log.emit(f"[PPPDownloadWorker] Error whilst downloading products: {e}")
+                self.error.emit(e)
                 return
 
         self.finished.emit("[PPPDownloadWorker] Downloaded all products successfully.")
\ No newline at end of file
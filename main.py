@@ -1,15 +1,28 @@
 import sys
+import queue
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from PySide6.QtWidgets import QApplication
 from app.main_window import MainWindow
 
+# Records are queued by the calling thread and written to the terminal by the listener's thread,
+# so download/worker threads never block on stdout
+_log_queue = queue.SimpleQueue()
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+log_listener = QueueListener(_log_queue, _stream_handler)
+
+# --debug also logs full worker tracebacks
 logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
+    level=logging.DEBUG if "--debug" in sys.argv else logging.INFO,
+    handlers=[QueueHandler(_log_queue)]
 )
 
 if __name__ == "__main__":
+    log_listener.start()
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    log_listener.stop()  # Flushes any queued records
+    sys.exit(exit_code)
@@ -0,0 +1,109 @@
+import os
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import pandas as pd
+
+from app.models.dl_products import BASE_URL, PRODUCT_FILENAME_RE, _parse_long_filenames, _parse_short_filenames, \
+    _product_urls, _warm_connections, get_session
+
+
+class TestProductFilenames(unittest.TestCase):
+    def test_parse_short_filenames(self):
+        products = _parse_short_filenames(["cod20623.clk.Z", "cod20627.erp.Z", "cod20620.sp3.Z"], 2062)
+        self.assertEqual(products["analysis_center"].tolist(), ["COD", "COD", "COD"])
+        self.assertEqual(products["format"].tolist(), ["CLK", "ERP", "SP3"])
+        self.assertEqual(products["solution_type"].tolist(), ["FIN", "FIN", "FIN"])
+
+        # GPS week 2062 starts 2019-07-14, day 3 is a daily product, day 7 the weekly one
+        self.assertEqual(products["date"].tolist()[:2], [pd.Timestamp("2019-07-17"), pd.Timestamp("2019-07-14")])
+        self.assertEqual(products["period"].tolist()[:2], [pd.Timedelta(days=1), pd.Timedelta(days=7)])
+
+        # Day 0 is treated as covering the whole week from its start, as the per-file parser did
+        self.assertEqual(products["date"].tolist()[2], pd.Timestamp("2019-07-14"))
+        self.assertEqual(products["period"].tolist()[2], pd.Timedelta(days=7))
+
+    def test_parse_long_filenames(self):
+        products = _parse_long_filenames(["GRG0OPSFIN_20232620000_01D_01D_SOL.SNX.gz",
+                                          "COD0OPSRAP_20241001200_01D_05M_CLK.CLK.gz"])
+        self.assertEqual(products["analysis_center"].tolist(), ["GRG", "COD"])
+        self.assertEqual(products["project"].tolist(), ["OPS", "OPS"])
+        self.assertEqual(products["solution_type"].tolist(), ["FIN", "RAP"])
+        self.assertEqual(products["date"].tolist(), [pd.Timestamp("2023-09-19 00:00"), pd.Timestamp("2024-04-09 12:00")])
+        self.assertEqual(products["period"].tolist(), [pd.Timedelta(days=1), pd.Timedelta(days=1)])
+        self.assertEqual(products["resolution"].tolist(), ["01D", "05M"])
+        self.assertEqual(products["content"].tolist(), ["SOL", "CLK"])
+        self.assertEqual(products["format"].tolist(), ["SNX", "CLK"])
+
+    def test_drops_non_conforming_filenames(self):
+        self.assertEqual(len(_parse_short_filenames(["cod20623.clk.Z", "MD5SUMS", "README"], 2062)), 1,
+                         "Only the product filename should be parsed")
+        self.assertEqual(len(_parse_long_filenames(["GRG0OPSFIN_20232620000_01D_01D_SOL.SNX.gz", "MD5SUMS"])), 1,
+                         "Only the product filename should be parsed")
+
+        # md5 sidecars in a listing reduce to the product they belong to
+        listing = (b'<a href="cod20623.clk.Z">cod20623.clk.Z</a> <a href="cod20623.clk.Z.md5">cod20623.clk.Z.md5</a>'
+                   b'<a href="GRG0OPSFIN_20232620000_01D_01D_SOL.SNX.gz.md5">GRG0OPSFIN_20232620000_01D_01D_SOL.SNX.gz.md5</a>'
+                   b'<a href="MD5SUMS">MD5SUMS</a>')
+        filenames = list(dict.fromkeys(match.decode() for match in PRODUCT_FILENAME_RE.findall(listing)))
+        self.assertEqual(filenames, ["cod20623.clk.Z", "GRG0OPSFIN_20232620000_01D_01D_SOL.SNX.gz"])
+
+    def test_parsed_rows_round_trip_to_urls(self):
+        short_names = ["cod20623.clk.Z", "cod20627.erp.Z"]
+        long_names = ["GRG0OPSFIN_20232620000_01D_01D_SOL.SNX.gz", "COD0OPSRAP_20241001200_01D_05M_CLK.CLK.gz"]
+        products = pd.concat([_parse_short_filenames(short_names, 2062), _parse_long_filenames(long_names)],
+                             ignore_index=True)
+        self.assertEqual(_product_urls(products), [
+            f"{BASE_URL}/gnss/products/2062/cod20623.clk.Z",
+            f"{BASE_URL}/gnss/products/2062/cod20627.erp.Z",
+            f"{BASE_URL}/gnss/products/2280/GRG0OPSFIN_20232620000_01D_01D_SOL.SNX.gz",
+            f"{BASE_URL}/gnss/products/2309/COD0OPSRAP_20241001200_01D_05M_CLK.CLK.gz",
+        ])
+
+    def test_no_products_no_urls(self):
+        self.assertEqual(_product_urls(pd.DataFrame()), [])
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keeps connections open between requests
+
+    def do_HEAD(self):
+        self._reply(b"")
+
+    def do_GET(self):
+        self._reply(b"ok")
+
+    def _reply(self, body: bytes):
+        self.server.client_ports.add(self.client_address[1])
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestWarmConnections(unittest.TestCase):
+    def test_downloads_reuse_warmed_connections(self):
+        servers = []
+        for _ in range(2):  # Warm-up is skipped for a single host
+            server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+            server.client_ports = set()
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            self.addCleanup(server.server_close)
+            self.addCleanup(server.shutdown)
+            servers.append(server)
+        urls = [f"http://127.0.0.1:{server.server_port}/file.txt" for server in servers]
+
+        with mock.patch.dict(os.environ, {"NO_PROXY": "127.0.0.1", "no_proxy": "127.0.0.1"}):
+            _warm_connections(urls, get_session())
+            for server in servers:
+                self.assertEqual(len(server.client_ports), 1, "Warm-up should open one connection per host")
+            for url in urls:
+                get_session().get(url, timeout=5).close()
+
+        for server in servers:
+            self.assertEqual(len(server.client_ports), 1, "Downloads should reuse the warmed connection")
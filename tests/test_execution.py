@@ -13,6 +13,13 @@ class TestExecution(unittest.TestCase):
         execution = Execution(config_path=Path(files("tests.resources").joinpath("ppp_example.yaml")))
         self.assertFalse(execution.config.values() == {}, "Caches ppp_example config from tests/resources/ppp_example.yaml")
 
+    def test_cached_config_not_shared(self):
+        config_path = Path(files("tests.resources").joinpath("ppp_example.yaml"))
+        first = Execution(config_path=config_path)
+        second = Execution(config_path=config_path)
+        self.assertIsNot(first.config, second.config, "Each Execution should edit its own copy of the cached config")
+        self.assertEqual(first.config, second.config, "Unchanged config file should load identically")
+
     def test_copies_template_config(self):
         test_config_path = files("tests.resources").joinpath("non_existent.yaml")
         if os.path.isfile(str(test_config_path)):